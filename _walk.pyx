@@ -0,0 +1,95 @@
+# cython: language_level=3
+"""
+Optional C accelerator for PyCleaner's directory listing (POSIX only).
+
+Reads a directory with opendir/readdir and filters entries in C, so only
+subdirectory names ever become Python objects. PyCleaner falls back to
+os.scandir when this module is not built.
+
+Build in place (needs Cython and a C compiler):
+  cythonize -i _walk.pyx
+"""
+
+import os
+
+cimport libc.errno as cerrno
+from libc.string cimport strcmp
+from posix.stat cimport struct_stat, lstat, S_ISDIR
+
+
+cdef extern from "<dirent.h>" nogil:
+    ctypedef struct DIR:
+        pass
+
+    struct dirent:
+        unsigned char d_type
+        char d_name[1]
+
+    enum:
+        DT_UNKNOWN
+        DT_DIR
+
+    DIR *opendir(const char *name)
+    dirent *readdir(DIR *dirp)
+    int closedir(DIR *dirp)
+
+
+cdef inline bint _is_dot(const char *name) nogil:
+    return name[0] == b'.' and (name[1] == 0 or (name[1] == b'.' and name[2] == 0))
+
+
+def list_dir(bytes path):
+    """
+    Same contract as pycleaner._list_dir, for an fsencoded path.
+    Returns (has_venv, subdir_names), or None if the directory could not be read.
+    Symlinks are never treated as directories.
+    """
+    cdef const char *cpath = path
+    cdef DIR *d
+    cdef dirent *e
+    cdef struct_stat st
+    cdef bint is_dir
+    cdef bint has_venv = False
+    cdef list names = []
+
+    with nogil:
+        d = opendir(cpath)
+    if d == NULL:
+        return None
+
+    try:
+        while True:
+            cerrno.errno = 0
+            with nogil:
+                e = readdir(d)
+            if e == NULL:
+                if cerrno.errno != 0:
+                    return None
+                break
+
+            if _is_dot(e.d_name):
+                continue
+
+            if e.d_type == DT_DIR:
+                is_dir = True
+            elif e.d_type == DT_UNKNOWN:
+                # Filesystem doesn't report types: fall back to lstat
+                full = os.path.join(path, <bytes>e.d_name)
+                is_dir = lstat(full, &st) == 0 and S_ISDIR(st.st_mode)
+            else:
+                # Files, symlinks (DT_LNK), devices, ...
+                is_dir = False
+
+            if not is_dir:
+                continue
+
+            # IMPORTANT: exact match, case-sensitive. Never descended into.
+            if strcmp(e.d_name, b"venv") == 0:
+                has_venv = True
+                continue
+
+            names.append(os.fsdecode(<bytes>e.d_name))
+    finally:
+        closedir(d)
+
+    return has_venv, tuple(names)
@@ -22,7 +22,9 @@ Features:
 - User-provided base path for scanning
 - Cross-platform path support (Linux/macOS/Windows)
 - Recursively searches for directories named exactly: "venv"
-- Displays results with checkboxes + Select All
+  (skipping .git, node_modules, __pycache__, ... — configurable per scan)
+- Caches directory listings between scans (re-read when a folder's mtime changes)
+- Displays results with checkboxes + Select All, streamed in live while scanning (cancelable)
 - Confirmation prompt ("Are you sure?") before deletion
 - Deletes selected folders (recursive)
 - Refreshes the list after deletion
@@ -33,6 +35,7 @@ Safety notes:
 - Deletion is permanent (uses shutil.rmtree).
 - Only directories named EXACTLY "venv" are listed.
 - Symlinks are skipped to avoid deleting linked locations unintentionally.
+- Directories reachable twice (bind mounts) are only scanned once.
 - The app will not delete the base path itself unless it is literally named "venv"
   (still must be selected).
 
@@ -58,15 +61,34 @@ v1.0.1
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import json
 import os
+import pickle
 import shutil
+import stat
+import sys
 import time
 import webbrowser
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 
-from flask import Flask, request, redirect, url_for, render_template_string, flash
+from flask import Flask, Response, request, redirect, url_for, flash, make_response, session
+
+try:
+    from waitress import serve as waitress_serve  # optional: pip install waitress
+except ImportError:
+    waitress_serve = None
+
+try:
+    import _walk  # optional C directory lister: cythonize -i _walk.pyx
+except ImportError:
+    _walk = None
 
 
 # ============================================================
@@ -77,6 +99,7 @@ APP_NAME = "PyCleaner"
 VERSION = "1.0.1"
 HOST = "127.0.0.1"
 PORT = 5055
+SERVER_THREADS = 8
 SECRET_KEY = os.environ.get("PYCLEANER_SECRET", "pycleaner-dev-secret-change-me")
 
 # Hard safety limits (helps avoid scanning the whole planet by accident)
@@ -87,8 +110,37 @@ DEFAULT_EXAMPLE_PATHS = {
     "win": r"C:\Users\<user>\Projects  or  D:\dev",
 }
 
-# Optional: small delay used to make progress overlay visible even for quick actions
-UI_DELAY_SECONDS = 0.05
+# Folders never descended into while scanning (no venv of interest lives there).
+# Overridable per scan with ?exclude=name1,name2
+PRUNE_NAMES = frozenset({
+    ".git", "node_modules", "__pycache__", ".tox", ".mypy_cache", ".pytest_cache",
+    ".venv", "site-packages",
+})
+
+# Parallel directory reads during a scan (I/O bound, so more threads than cores).
+# Each pool task walks a subtree for up to SCAN_TASK_SECONDS before handing its
+# unfinished directories back, so pool overhead is per slice, not per directory.
+SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+SCAN_TASK_SECONDS = 0.05
+
+# Keep-alive interval for the streaming scan endpoint
+SSE_HEARTBEAT_SECONDS = 5
+
+# Selected venvs removed in parallel
+DELETE_WORKERS = 8
+
+# Directory-listing cache, reused across scans and restarts. It pays off on
+# slow or remote storage (network shares, cold spinning disks); on a warm local
+# disk a listing costs about as much as the cache bookkeeping.
+CACHE_FILE = os.environ.get(
+    "PYCLEANER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "pycleaner", "dircache.pickle"),
+)
+DIR_CACHE_MAX_ENTRIES = 200_000
+
+# Back-to-back scans of the same path within this window reuse the last result
+SCAN_CACHE_TTL_SECONDS = 30
+SCAN_CACHE_SIZE = 32
 
 
 app = Flask(__name__)
@@ -106,10 +158,183 @@ class ScanResult:
     error: Optional[str] = None
 
 
+class DirCache:
+    """
+    Disk-backed cache of directory listings for the scanner, aimed at slow or
+    remote storage where a stat is much cheaper than reading the directory.
+    Keyed by absolute path (callers pass normalize_path() output as-is).
+    An entry is (mtime_ns, has_venv, subdir_names) and is only used while the
+    directory's mtime is unchanged (adding, removing or renaming a child bumps it).
+    Bounded: at most `max_entries` are kept, least recently used go first.
+    Thread-safe; loaded lazily on first use and written back by save().
+    """
+
+    # Listings younger than this are not cached: a change landing in the same
+    # mtime tick (coarse on some filesystems) would otherwise go unnoticed.
+    MIN_AGE_NS = 2_000_000_000
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def _load(self):
+        # Caller holds the lock
+        self._loaded = True
+        try:
+            with open(self.path, "rb") as f:
+                entries = pickle.load(f)
+            if isinstance(entries, dict):
+                self._entries = OrderedDict(entries)
+                self._evict()
+        except Exception:
+            # Missing, unreadable or stale-format cache: start empty
+            self._entries = OrderedDict()
+
+    def _evict(self):
+        # Caller holds the lock
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, path: str, mtime_ns: int) -> Optional[Tuple[bool, Tuple[str, ...]]]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != mtime_ns:
+                return None
+            self._entries.move_to_end(path)
+        return entry[1], entry[2]
+
+    def put(self, path: str, mtime_ns: int, has_venv: bool, subdirs: Tuple[str, ...]):
+        if time.time_ns() - mtime_ns < self.MIN_AGE_NS:
+            return
+        with self._lock:
+            self._entries[path] = (mtime_ns, has_venv, subdirs)
+            self._entries.move_to_end(path)
+            self._evict()
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._entries = OrderedDict()
+            self._loaded = True
+            self._dirty = False
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    def save(self):
+        """
+        Write the cache to disk if it changed. Best effort: errors are ignored.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = f"{self.path}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with open(tmp, "wb") as f:
+                    pickle.dump(self._entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, self.path)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+dir_cache = DirCache(CACHE_FILE, DIR_CACHE_MAX_ENTRIES)
+atexit.register(dir_cache.save)
+
+
 # ============================================================
 # Helpers
 # ============================================================
 
+def ttl_cache(ttl: float, maxsize: int = 32, cache_if=None):
+    """
+    Memoize a function's results for `ttl` seconds, keeping at most `maxsize` (LRU).
+    If `cache_if` is given, only results for which cache_if(result) is true are kept.
+    Adds cache_clear() to the wrapped function.
+    """
+    def decorator(fn):
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and now - hit[0] < ttl:
+                    entries.move_to_end(key)
+                    return hit[1]
+
+            value = fn(*args, **kwargs)
+            if cache_if is not None and not cache_if(value):
+                return value
+            with lock:
+                entries[key] = (now, value)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def parse_exclude(raw: Optional[str]) -> frozenset:
+    """
+    Folder names to skip while scanning, from a comma-separated string.
+    None (parameter absent) means PRUNE_NAMES; an empty string skips nothing.
+    """
+    if raw is None:
+        return PRUNE_NAMES
+    return frozenset(n.strip() for n in raw.split(",") if n.strip())
+
+
+def scan_warnings(base_path: str, count: int) -> List[str]:
+    """
+    Heads-up messages for a finished scan (huge root, result limit hit).
+    """
+    warnings: List[str] = []
+    if os.path.abspath(base_path) in (os.path.abspath(os.sep), os.path.abspath(os.path.expanduser("~"))):
+        warnings.append("Heads up: scanning very large roots can be slow. Consider narrowing to a projects folder.")
+    if count >= MAX_RESULTS:
+        warnings.append(f"Result limit reached ({MAX_RESULTS}). Narrow your scan path for more precise results.")
+    return warnings
+
+
+def results_etag(r: ScanResult, exclude: frozenset) -> str:
+    """
+    Validator for a results page: changes whenever the listed venvs do.
+    """
+    h = hashlib.sha256()
+    h.update(f"{r.base_path}|{','.join(sorted(exclude))}|{r.error}".encode("utf-8", "surrogateescape"))
+    for p in r.found:
+        h.update(b"\0" + p.encode("utf-8", "surrogateescape"))
+    return h.hexdigest()[:32]
+
+
+def sse_event(data: dict, event: Optional[str] = None) -> str:
+    """
+    Format one Server-Sent Events message.
+    """
+    head = f"event: {event}\n" if event else ""
+    return f"{head}data: {json.dumps(data)}\n\n"
+
+
 def open_browser(url: str, delay: float = 0.5):
     """
     Open the default web browser after a short delay.
@@ -125,14 +350,14 @@ def open_browser(url: str, delay: float = 0.5):
 def normalize_path(p: str) -> str:
     """
     Normalize a user-supplied path for the current OS.
-    Expands ~ and environment variables, and normalizes separators.
+    Expands ~ and environment variables, normalizes separators and makes it absolute.
     """
     p = (p or "").strip()
     if not p:
         return ""
     p = os.path.expandvars(p)
     p = os.path.expanduser(p)
-    p = os.path.normpath(p)
+    p = os.path.abspath(p)
     return p
 
 
@@ -150,52 +375,248 @@ def is_safe_base_path(p: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def find_venv_dirs(base_path: str, limit: int = MAX_RESULTS) -> ScanResult:
+def _list_dir(path: str) -> Optional[Tuple[bool, Tuple[str, ...]]]:
     """
-    Recursively search for directories named exactly 'venv' under base_path.
-    Skips symlinked directories to reduce risk.
+    Read one directory from disk.
+    Returns (has_venv, subdir_names), or None if it could not be read.
+    Symlinks and the matched 'venv' itself are not included in subdir_names.
+    Uses the _walk extension when it is built, os.scandir otherwise.
     """
-    base_path = normalize_path(base_path)
-    ok, msg = is_safe_base_path(base_path)
-    if not ok:
-        return ScanResult(base_path=base_path, found=[], error=msg)
+    if _walk is not None:
+        return _walk.list_dir(os.fsencode(path))
 
-    found: List[str] = []
+    has_venv = False
+    names: List[str] = []
     try:
-        for root, dirs, files in os.walk(base_path, topdown=True, followlinks=False):
-            # Remove symlinked dirs from traversal
-            pruned = []
-            for d in dirs:
-                full = os.path.join(root, d)
+        with os.scandir(path) as it:
+            for entry in it:
                 try:
-                    if os.path.islink(full):
+                    # DirEntry caches the type from the directory read itself, so
+                    # this costs no stat call; it is also False for symlinks.
+                    if not entry.is_dir(follow_symlinks=False):
                         continue
                 except OSError:
                     continue
-                pruned.append(d)
-            dirs[:] = pruned
 
-            # If a directory named 'venv' is present in this level, record its full path.
-            # IMPORTANT: exact match, case-sensitive.
-            if "venv" in dirs:
-                venv_path = os.path.join(root, "venv")
-                found.append(os.path.normpath(venv_path))
-                if len(found) >= limit:
-                    break
+                # IMPORTANT: exact match, case-sensitive.
+                # A match is recorded but never descended into: nothing inside
+                # a venv is of interest, and site-packages is most of the tree.
+                if entry.name == "venv":
+                    has_venv = True
+                    continue
+
+                names.append(entry.name)
+    except OSError:
+        return None
+    return has_venv, tuple(names)
+
+
+class _VisitedDirs:
+    """
+    Thread-safe record of the directories one scan has already listed, by
+    (st_dev, st_ino), so bind mounts and other aliases are only walked once.
+    Not tracked on Windows, where inode numbers are not dependable.
+    """
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def first_visit(self, st: os.stat_result) -> bool:
+        if sys.platform == "win32" or not st.st_ino:
+            return True
+        key = (st.st_dev, st.st_ino)
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+        return True
+
+
+def _scan_dir(path: str, exclude: frozenset, visited: _VisitedDirs) -> Tuple[List[str], List[str]]:
+    """
+    List a single directory for the scanner, via dir_cache when it is current.
+    Returns (venv_paths, subdirs_to_descend); subdirectories named in `exclude`
+    are not descended into, and an unreadable or already-visited directory
+    yields nothing.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [], []
+    if not visited.first_visit(st):
+        return [], []
+    mtime_ns = st.st_mtime_ns
+
+    listing = dir_cache.get(path, mtime_ns)
+    if listing is None:
+        listing = _list_dir(path)
+        if listing is None:
+            return [], []
+        dir_cache.put(path, mtime_ns, *listing)
+
+    # Join once per directory, then plain concatenation per child. path is
+    # already normalized (base_path went through normalize_path), so the
+    # results need no normpath either.
+    prefix = os.path.join(path, "")
+    has_venv, names = listing
+    hits = [prefix + "venv"] if has_venv else []
+    return hits, [prefix + n for n in names if n not in exclude]
+
+
+def _scan_subtrees(roots: List[str], exclude: frozenset, visited: _VisitedDirs) -> Tuple[List[str], List[str]]:
+    """
+    One pool task: depth-first walk from roots for up to SCAN_TASK_SECONDS.
+    Returns (venv_paths, unfinished_dirs); the caller re-queues the latter.
+    """
+    hits: List[str] = []
+    stack = list(roots)
+    deadline = time.monotonic() + SCAN_TASK_SECONDS
+    while stack:
+        found, subdirs = _scan_dir(stack.pop(), exclude, visited)
+        hits.extend(found)
+        stack.extend(subdirs)
+        if time.monotonic() >= deadline:
+            break
+    return hits, stack
+
+
+class _LimitReached(Exception):
+    """
+    Scan result limit hit; carries the final (partial) batch.
+    """
+    def __init__(self, batch: List[str]):
+        super().__init__()
+        self.batch = batch
+
 
+def _walk_venv_dirs(
+    base_path: str,
+    limit: int,
+    exclude: frozenset = PRUNE_NAMES,
+    tick: Optional[float] = None,
+) -> Iterator[List[str]]:
+    """
+    Parallel scan engine behind find_venv_dirs and the streaming endpoint.
+    Yields lists of newly found venv paths as their parent directories are read,
+    at most `limit` paths in total. With `tick` set, something is yielded at
+    least every `tick` seconds (an empty list when nothing new was found), so
+    the caller can send keep-alives and notice when it should stop.
+    base_path must already be normalized and validated.
+    """
+    count = 0
+    visited = _VisitedDirs()
+    last_yield = time.monotonic()
+    # Directory reads are mostly I/O wait, so overlap them. Workers walk whole
+    # subtrees locally and only hand back what they didn't finish in their time
+    # slice; that leftover is split across idle workers. On a warm local disk
+    # this stays close to a plain serial walk, on slow storage it keeps
+    # SCAN_WORKERS reads in flight.
+    # (An io_uring backend was considered: the kernel has no getdents op for
+    # it, and the worker threads already give the overlap.)
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_subtrees, [base_path], exclude, visited)}
+        try:
+            while pending:
+                timeout = None if tick is None else max(0.0, last_yield + tick - time.monotonic())
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                batch: List[str] = []
+                for fut in done:
+                    hits, rest = fut.result()
+                    for hit in hits:
+                        batch.append(hit)
+                        if count + len(batch) >= limit:
+                            raise _LimitReached(batch)
+                    if rest:
+                        parts = max(1, min(len(rest), SCAN_WORKERS - len(pending)))
+                        pending.update(
+                            pool.submit(_scan_subtrees, rest[i::parts], exclude, visited)
+                            for i in range(parts)
+                        )
+
+                count += len(batch)
+                if batch or (tick is not None and time.monotonic() - last_yield >= tick):
+                    yield batch
+                    last_yield = time.monotonic()
+        except _LimitReached as stop:
+            # Raised from the innermost loop, so nothing more gets queued
+            yield stop.batch
+        finally:
+            # Limit reached or caller stopped early: drop queued work,
+            # let in-flight reads finish
+            for fut in pending:
+                fut.cancel()
+
+
+@ttl_cache(ttl=SCAN_CACHE_TTL_SECONDS, maxsize=SCAN_CACHE_SIZE, cache_if=lambda r: r.error is None)
+def find_venv_dirs(
+    base_path: str,
+    limit: int = MAX_RESULTS,
+    exclude: frozenset = PRUNE_NAMES,
+) -> ScanResult:
+    """
+    Recursively search for directories named exactly 'venv' under base_path.
+    Skips symlinked directories to reduce risk, and never descends into
+    folders named in `exclude` (.git, node_modules, ... by default).
+    Matched 'venv' directories are not searched any further, so a 'venv'
+    nested inside another 'venv' is not listed on its own.
+    Successful results are memoized briefly; call find_venv_dirs.cache_clear()
+    after changing anything on disk (a change can sit under several memoized bases).
+    """
+    base_path = normalize_path(base_path)
+    ok, msg = is_safe_base_path(base_path)
+    if not ok:
+        return ScanResult(base_path=base_path, found=[], error=msg)
+
+    found: List[str] = []
+    try:
+        for batch in _walk_venv_dirs(base_path, limit, exclude):
+            found.extend(batch)
         found.sort()
         return ScanResult(base_path=base_path, found=found, error=None)
     except Exception as e:
         return ScanResult(base_path=base_path, found=[], error=f"Scan error: {e}")
 
 
+def _split_tree(path: str, want: int = DELETE_WORKERS * 4, max_depth: int = 6) -> List[str]:
+    """
+    Break the tree under path into independent subtrees that can be removed in
+    parallel, expanding breadth-first (never through symlinks) until there are
+    at least `want` of them. Returns subdirectory roots only, never path itself;
+    files directly inside expanded directories are left for the caller.
+    """
+    frontier = [path]
+    for _ in range(max_depth):
+        if len(frontier) >= want:
+            break
+        expanded: List[str] = []
+        grew = False
+        for d in frontier:
+            subdirs: List[str] = []
+            try:
+                with os.scandir(d) as it:
+                    subdirs = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+            except OSError:
+                pass
+            if subdirs:
+                expanded.extend(subdirs)
+                grew = True
+            else:
+                expanded.append(d)
+        if not grew:
+            break
+        frontier = expanded
+    return [d for d in frontier if d != path]
+
+
 def delete_dirs(selected: List[str]) -> Tuple[int, List[Tuple[str, str]]]:
     """
-    Delete selected directories using shutil.rmtree.
+    Delete selected directories using shutil.rmtree, several at a time.
     Returns (deleted_count, errors_list) where errors_list is (path, error_message).
     """
     deleted = 0
     errors: List[Tuple[str, str]] = []
+    targets: List[str] = []
 
     for p in selected:
         p = normalize_path(p)
@@ -205,24 +626,58 @@ def delete_dirs(selected: List[str]) -> Tuple[int, List[Tuple[str, str]]]:
             errors.append((p, "Skipped: not named 'venv'"))
             continue
 
-        # Safety: must exist and be a directory
-        if not os.path.exists(p):
+        # Safety: must exist, not be a symlink, and be a directory
+        # (one lstat instead of separate exists/isdir/islink calls)
+        try:
+            st = os.lstat(p)
+        except FileNotFoundError:
             errors.append((p, "Skipped: does not exist"))
             continue
-        if not os.path.isdir(p):
-            errors.append((p, "Skipped: not a directory"))
+        except OSError as e:
+            errors.append((p, f"Skipped: {e}"))
             continue
-
-        # Safety: skip symlinks
-        if os.path.islink(p):
+        if stat.S_ISLNK(st.st_mode):
             errors.append((p, "Skipped: is a symlink"))
             continue
+        if not stat.S_ISDIR(st.st_mode):
+            errors.append((p, "Skipped: not a directory"))
+            continue
 
-        try:
-            shutil.rmtree(p)
-            deleted += 1
-        except Exception as e:
-            errors.append((p, str(e)))
+        if p not in targets:
+            targets.append(p)
+
+    # A venv inside another selected venv goes with its parent; deleting both
+    # would race the two rmtrees
+    chosen = set(targets)
+    nested = set()
+    for p in targets:
+        d = os.path.dirname(p)
+        while d != os.path.dirname(d):
+            if d in chosen:
+                nested.add(p)
+                errors.append((p, "Skipped: inside another selected venv"))
+                break
+            d = os.path.dirname(d)
+    targets = [p for p in targets if p not in nested]
+
+    if not targets:
+        return deleted, errors
+
+    # Each rmtree is a long serial walk of small files; run them side by side
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as pool:
+        # First fan each venv out into subtrees (site-packages entries, ...) so
+        # even a single large venv is unlinked by several threads. Errors are
+        # ignored here: the final rmtree of the venv itself reports anything left.
+        subtrees = [r for roots in pool.map(_split_tree, targets) for r in roots]
+        wait([pool.submit(shutil.rmtree, r, True) for r in subtrees])
+
+        futures = [(p, pool.submit(shutil.rmtree, p)) for p in targets]
+        for p, fut in futures:
+            try:
+                fut.result()
+                deleted += 1
+            except Exception as e:
+                errors.append((p, str(e)))
 
     return deleted, errors
 
@@ -294,7 +749,12 @@ TEMPLATE = r"""
         <div class="text-secondary">Find and delete <span class="mono">venv</span> folders safely-ish (with guardrails).</div>
       </div>
 
-      <div class="d-flex align-items-center gap-2">
+      <div class="d-flex align-items-center gap-3">
+        <form method="POST" action="/cache/clear" onsubmit="showProgressOverlay();">
+          <input type="hidden" name="base_path" value="{{ base_path or '' }}"/>
+          <input type="hidden" name="exclude" value="{{ exclude_text }}"/>
+          <button type="submit" class="btn btn-sm btn-outline-secondary" title="Forget cached directory listings">Clear cache</button>
+        </form>
         <div class="form-check form-switch">
           <input class="form-check-input" type="checkbox" role="switch" id="themeToggle">
           <label class="form-check-label" for="themeToggle">Light mode</label>
@@ -316,7 +776,7 @@ TEMPLATE = r"""
 
     <div class="card shadow-sm mb-3">
       <div class="card-body">
-        <form method="GET" action="/" onsubmit="showProgressOverlay();">
+        <form method="GET" action="/" id="scanForm" onsubmit="return startScan();">
           <div class="d-flex flex-column flex-lg-row gap-2 align-items-lg-end">
             <div class="flex-grow-1">
               <label class="form-label">
@@ -325,12 +785,18 @@ TEMPLATE = r"""
                   <span class="fw-semibold">i</span>
                 </button>
               </label>
-              <input class="form-control mono" name="path" placeholder="e.g. /home/<user>/projects   or   C:\Users\<user>\Projects" value="{{ base_path or '' }}">
+              <input class="form-control mono" name="path" id="pathInput" placeholder="e.g. /home/<user>/projects   or   C:\Users\<user>\Projects" value="{{ base_path or '' }}">
               <div class="form-text">
                 Scans recursively for directories named exactly: <span class="mono">venv</span>
               </div>
             </div>
 
+            <div style="min-width: 18rem;">
+              <label class="form-label" for="excludeInput">Skip folders named</label>
+              <input class="form-control mono" name="exclude" id="excludeInput" value="{{ exclude_text }}">
+              <div class="form-text">Comma-separated; never descended into.</div>
+            </div>
+
             <div class="d-grid">
               <button class="btn btn-primary px-4" type="submit">Scan</button>
             </div>
@@ -342,7 +808,10 @@ TEMPLATE = r"""
         <!-- Always-on progress bar area (idle vs active) -->
         <div class="d-flex align-items-center justify-content-between mb-2">
           <div class="small text-secondary">Status</div>
-          <div class="small text-secondary" id="statusText">Idle</div>
+          <div class="d-flex align-items-center gap-2">
+            <div class="small text-secondary" id="statusText">Idle</div>
+            <button type="button" class="btn btn-outline-danger btn-sm py-0 d-none" id="cancelScan" onclick="cancelScan()">Cancel</button>
+          </div>
         </div>
         <div class="progress progress-idle" role="progressbar" aria-label="Status">
           <div id="statusBar" class="progress-bar" style="width: 100%"></div>
@@ -350,74 +819,71 @@ TEMPLATE = r"""
       </div>
     </div>
 
-    {% if scanned %}
-      <div class="card shadow-sm">
-        <div class="card-body">
-          <div class="d-flex flex-wrap gap-2 align-items-center justify-content-between mb-2">
-            <div>
-              <div class="fw-semibold">Scan results</div>
-              <div class="text-secondary small">
-                Base path:
-                <span class="badge text-bg-secondary path-chip mono">{{ base_path }}</span>
-              </div>
-            </div>
+    <div id="scanNotices"></div>
+
+    <div class="card shadow-sm {{ '' if scanned else 'd-none' }}" id="resultsCard">
+      <div class="card-body">
+        <div class="d-flex flex-wrap gap-2 align-items-center justify-content-between mb-2">
+          <div>
+            <div class="fw-semibold">Scan results</div>
             <div class="text-secondary small">
-              Found: <span class="fw-semibold">{{ results|length }}</span>
+              Base path:
+              <span class="badge text-bg-secondary path-chip mono" id="resultBase">{{ base_path }}</span>
             </div>
           </div>
+          <div class="text-secondary small">
+            Found: <span class="fw-semibold" id="foundCount">{{ results|length }}</span>
+          </div>
+        </div>
+
+        <div class="alert alert-danger {{ '' if scan_error else 'd-none' }}" id="scanError">{{ scan_error or '' }}</div>
+
+        <div class="alert alert-warning mb-0 {{ '' if (results|length == 0 and not scan_error) else 'd-none' }}" id="noResults">
+          No directories named <span class="mono">venv</span> found under that path.
+        </div>
+
+        <form method="POST" action="/delete" onsubmit="return confirmDelete();" id="deleteForm" class="{{ '' if results|length > 0 else 'd-none' }}">
+          <input type="hidden" name="base_path" id="deleteBase" value="{{ base_path }}"/>
+          <input type="hidden" name="exclude" id="deleteExclude" value="{{ exclude_text }}"/>
 
-          {% if scan_error %}
-            <div class="alert alert-danger">{{ scan_error }}</div>
-          {% endif %}
+          <div class="d-flex flex-wrap gap-2 align-items-center mb-3">
+            <button type="button" class="btn btn-outline-secondary btn-sm" onclick="toggleAll(true)">Select all</button>
+            <button type="button" class="btn btn-outline-secondary btn-sm" onclick="toggleAll(false)">Select none</button>
 
-          {% if results|length == 0 and not scan_error %}
-            <div class="alert alert-warning mb-0">
-              No directories named <span class="mono">venv</span> found under that path.
+            <div class="ms-auto d-flex gap-2">
+              <button type="submit" class="btn btn-danger btn-sm px-3">
+                Delete selected
+              </button>
             </div>
-          {% elif results|length > 0 %}
-            <form method="POST" action="/delete" onsubmit="return confirmDelete();">
-              <input type="hidden" name="base_path" value="{{ base_path }}"/>
-
-              <div class="d-flex flex-wrap gap-2 align-items-center mb-3">
-                <button type="button" class="btn btn-outline-secondary btn-sm" onclick="toggleAll(true)">Select all</button>
-                <button type="button" class="btn btn-outline-secondary btn-sm" onclick="toggleAll(false)">Select none</button>
-
-                <div class="ms-auto d-flex gap-2">
-                  <button type="submit" class="btn btn-danger btn-sm px-3">
-                    Delete selected
-                  </button>
-                </div>
-              </div>
+          </div>
 
-              <div class="table-responsive" style="max-height: 50vh;">
-                <table class="table table-hover align-middle">
-                  <thead class="sticky-top">
-                    <tr>
-                      <th style="width: 56px;">Del</th>
-                      <th>venv path</th>
-                    </tr>
-                  </thead>
-                  <tbody>
-                    {% for p in results %}
-                      <tr>
-                        <td>
-                          <input class="form-check-input venvCheck" type="checkbox" name="selected" value="{{ p }}">
-                        </td>
-                        <td class="mono">{{ p }}</td>
-                      </tr>
-                    {% endfor %}
-                  </tbody>
-                </table>
-              </div>
+          <div class="table-responsive" style="max-height: 50vh;">
+            <table class="table table-hover align-middle">
+              <thead class="sticky-top">
+                <tr>
+                  <th style="width: 56px;">Del</th>
+                  <th>venv path</th>
+                </tr>
+              </thead>
+              <tbody id="resultsBody">
+                {% for p in results %}
+                  <tr>
+                    <td>
+                      <input class="form-check-input venvCheck" type="checkbox" name="selected" value="{{ p }}">
+                    </td>
+                    <td class="mono">{{ p }}</td>
+                  </tr>
+                {% endfor %}
+              </tbody>
+            </table>
+          </div>
 
-              <div class="small text-secondary mt-3">
-                Guardrail: only items whose final folder name is exactly <span class="mono">venv</span> will be deleted.
-              </div>
-            </form>
-          {% endif %}
-        </div>
+          <div class="small text-secondary mt-3">
+            Guardrail: only items whose final folder name is exactly <span class="mono">venv</span> will be deleted.
+          </div>
+        </form>
       </div>
-    {% endif %}
+    </div>
 
     <div class="text-secondary small mt-3">
       Tip: scanning huge roots can be slow. Aim at a projects directory rather than scanning your entire disk.
@@ -463,6 +929,7 @@ TEMPLATE = r"""
 
           <ul class="mb-0">
             <li>Symlinked directories are skipped (safer).</li>
+            <li>Folders listed under "Skip folders named" (<span class="mono">.git</span>, <span class="mono">node_modules</span>, …) are not searched.</li>
             <li>Only folders named exactly <span class="mono">venv</span> appear in results.</li>
             <li>Deleting uses <span class="mono">shutil.rmtree()</span> (permanent).</li>
           </ul>
@@ -499,8 +966,13 @@ TEMPLATE = r"""
       applyTheme(theme);
     });
 
-    // Progress overlay
+    // Progress overlay. It stays up for at least MIN_OVERLAY_MS across the
+    // navigation it covers, so quick actions still register visually.
+    const MIN_OVERLAY_MS = 150;
+    const BUSY_KEY = "pycleaner_busy_since";
+
     function showProgressOverlay() {
+      sessionStorage.setItem(BUSY_KEY, String(Date.now()));
       document.getElementById("progressOverlay").style.display = "flex";
       // status bar text
       const statusText = document.getElementById("statusText");
@@ -521,8 +993,141 @@ TEMPLATE = r"""
       }
     }
 
-    // Hide overlay on load (in case of back/forward cache or weirdness)
-    window.addEventListener("load", () => hideProgressOverlay());
+    // Hide overlay on load (in case of back/forward cache or weirdness),
+    // once the minimum visible time has passed
+    window.addEventListener("load", () => {
+      const since = Number(sessionStorage.getItem(BUSY_KEY) || 0);
+      sessionStorage.removeItem(BUSY_KEY);
+      const remaining = since ? MIN_OVERLAY_MS - (Date.now() - since) : 0;
+      if (remaining > 0) {
+        document.getElementById("progressOverlay").style.display = "flex";
+        setTimeout(hideProgressOverlay, remaining);
+      } else {
+        hideProgressOverlay();
+      }
+    });
+
+    // Streaming scan: rows arrive over Server-Sent Events as they are found.
+    // Without JS the form falls back to a normal (blocking) GET.
+    let scanSource = null;
+
+    function show(el, on) {
+      el.classList.toggle("d-none", !on);
+    }
+
+    function setStatus(text, busy) {
+      document.getElementById("statusText").textContent = text;
+      const statusBar = document.getElementById("statusBar");
+      statusBar.classList.toggle("progress-bar-striped", busy);
+      statusBar.classList.toggle("progress-bar-animated", busy);
+      show(document.getElementById("cancelScan"), busy);
+    }
+
+    function addNotice(msg) {
+      const div = document.createElement("div");
+      div.className = "alert alert-warning mb-2";
+      div.textContent = msg;
+      document.getElementById("scanNotices").appendChild(div);
+    }
+
+    function addResultRow(path) {
+      const tr = document.createElement("tr");
+      const tdCheck = document.createElement("td");
+      const cb = document.createElement("input");
+      cb.className = "form-check-input venvCheck";
+      cb.type = "checkbox";
+      cb.name = "selected";
+      cb.value = path;
+      tdCheck.appendChild(cb);
+      const tdPath = document.createElement("td");
+      tdPath.className = "mono";
+      tdPath.textContent = path;
+      tr.append(tdCheck, tdPath);
+      document.getElementById("resultsBody").appendChild(tr);
+    }
+
+    function finishScan(text) {
+      if (scanSource) {
+        scanSource.close();
+        scanSource = null;
+      }
+      setStatus(text, false);
+    }
+
+    function startScan() {
+      if (!window.EventSource) return true;
+      const path = document.getElementById("pathInput").value.trim();
+      if (!path) return true;
+      const exclude = document.getElementById("excludeInput").value;
+      const query = "path=" + encodeURIComponent(path) + "&exclude=" + encodeURIComponent(exclude);
+
+      finishScan("Idle");
+      history.replaceState(null, "", "/?" + query);
+      document.getElementById("deleteExclude").value = exclude;
+
+      const foundCount = document.getElementById("foundCount");
+      const scanError = document.getElementById("scanError");
+      const noResults = document.getElementById("noResults");
+      const deleteForm = document.getElementById("deleteForm");
+      let found = 0;
+
+      document.getElementById("scanNotices").replaceChildren();
+      document.getElementById("resultsBody").replaceChildren();
+      document.getElementById("resultBase").textContent = path;
+      foundCount.textContent = "0";
+      show(scanError, false);
+      show(noResults, false);
+      show(deleteForm, true);
+      show(document.getElementById("resultsCard"), true);
+      setStatus("Scanning…", true);
+
+      scanSource = new EventSource("/scan/stream?" + query);
+
+      scanSource.addEventListener("start", (ev) => {
+        const base = JSON.parse(ev.data).base_path;
+        document.getElementById("resultBase").textContent = base;
+        document.getElementById("deleteBase").value = base;
+      });
+
+      scanSource.onmessage = (ev) => {
+        addResultRow(JSON.parse(ev.data).path);
+        found += 1;
+        foundCount.textContent = found;
+        setStatus("Scanning… " + found + " found", true);
+      };
+
+      scanSource.addEventListener("done", (ev) => {
+        const data = JSON.parse(ev.data);
+        data.warnings.forEach(addNotice);
+        show(noResults, found === 0);
+        show(deleteForm, found > 0);
+        finishScan("Done");
+      });
+
+      scanSource.addEventListener("scan_error", (ev) => {
+        scanError.textContent = JSON.parse(ev.data).error;
+        show(scanError, true);
+        show(deleteForm, found > 0);
+        finishScan("Error");
+      });
+
+      // Connection dropped: stop here rather than letting EventSource
+      // reconnect and start the scan over.
+      scanSource.onerror = () => {
+        if (!scanSource) return;
+        show(deleteForm, found > 0);
+        finishScan("Connection lost");
+      };
+
+      return false;
+    }
+
+    function cancelScan() {
+      if (!scanSource) return;
+      const found = document.querySelectorAll("#resultsBody .venvCheck").length;
+      show(document.getElementById("deleteForm"), found > 0);
+      finishScan("Cancelled");
+    }
 
     // Checkbox helpers
     function toggleAll(on) {
@@ -545,6 +1150,17 @@ TEMPLATE = r"""
 </html>
 """
 
+# Parsed once at import instead of on every request
+COMPILED_TEMPLATE = app.jinja_env.from_string(TEMPLATE)
+
+
+def render_page(**context) -> str:
+    """
+    Render COMPILED_TEMPLATE with Flask's usual template context.
+    """
+    app.update_template_context(context)
+    return COMPILED_TEMPLATE.render(context)
+
 
 # ============================================================
 # Routes
@@ -553,39 +1169,103 @@ TEMPLATE = r"""
 @app.route("/", methods=["GET"])
 def index():
     base_path = normalize_path(request.args.get("path", ""))
+    exclude = parse_exclude(request.args.get("exclude"))
 
     scanned = False
     results: List[str] = []
     scan_error: Optional[str] = None
+    etag: Optional[str] = None
 
     if base_path:
         scanned = True
-        # tiny delay so UI overlay is perceptible on fast scans
-        time.sleep(UI_DELAY_SECONDS)
-        r = find_venv_dirs(base_path)
+        r = find_venv_dirs(base_path, exclude=exclude)
         results = r.found
         scan_error = r.error
-        if not scan_error and os.path.abspath(base_path) in (os.path.abspath(os.sep), os.path.abspath(os.path.expanduser("~"))):
-            flash("Heads up: scanning very large roots can be slow. Consider narrowing to a projects folder.", "warn")
+        warnings = [] if scan_error else scan_warnings(base_path, len(results))
 
-        if len(results) >= MAX_RESULTS:
-            flash(f"Result limit reached ({MAX_RESULTS}). Narrow your scan path for more precise results.", "warn")
+        # Reloading an unchanged (usually memoized) result: let the browser
+        # reuse its copy. Never when messages are waiting to be shown.
+        if not warnings and not session.get("_flashes"):
+            etag = results_etag(r, exclude)
+            if request.if_none_match.contains_weak(etag):
+                resp = Response(status=304)
+                resp.set_etag(etag, weak=True)
+                return resp
 
-    return render_template_string(
-        TEMPLATE,
+        for msg in warnings:
+            flash(msg, "warn")
+
+    resp = make_response(render_page(
         app_name=APP_NAME,
         version=VERSION,
         base_path=base_path,
+        exclude_text=",".join(sorted(exclude)),
         scanned=scanned,
         results=results,
         scan_error=scan_error,
         examples=DEFAULT_EXAMPLE_PATHS,
+    ))
+    if etag:
+        resp.set_etag(etag, weak=True)
+        # Cacheable, but always revalidated (results can change underneath)
+        resp.headers["Cache-Control"] = "private, no-cache"
+    return resp
+
+
+@app.route("/scan/stream", methods=["GET"])
+def scan_stream():
+    """
+    Stream scan results as Server-Sent Events: a "start" event with the
+    normalized base path, one unnamed message per venv found, "heartbeat"
+    keep-alives, then "done" (or "scan_error").
+    """
+    base_path = normalize_path(request.args.get("path", ""))
+    exclude = parse_exclude(request.args.get("exclude"))
+
+    def generate():
+        ok, msg = is_safe_base_path(base_path)
+        if not ok:
+            yield sse_event({"error": msg}, "scan_error")
+            return
+
+        yield sse_event({"base_path": base_path}, "start")
+        count = 0
+        try:
+            for batch in _walk_venv_dirs(base_path, MAX_RESULTS, exclude, tick=SSE_HEARTBEAT_SECONDS):
+                if not batch:
+                    yield sse_event({"count": count}, "heartbeat")
+                for p in batch:
+                    count += 1
+                    yield sse_event({"path": p})
+        except Exception as e:
+            yield sse_event({"error": f"Scan error: {e}"}, "scan_error")
+            return
+
+        yield sse_event({"count": count, "warnings": scan_warnings(base_path, count)}, "done")
+
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@app.route("/cache/clear", methods=["POST"])
+def cache_clear():
+    base_path = normalize_path(request.form.get("base_path", ""))
+    exclude = request.form.get("exclude")
+    dir_cache.clear()
+    find_venv_dirs.cache_clear()
+    flash("Directory cache cleared.", "ok")
+    if not base_path:
+        return redirect(url_for("index"))
+    return redirect(url_for("index", path=base_path, exclude=exclude))
+
+
 @app.route("/delete", methods=["POST"])
 def delete():
     base_path = normalize_path(request.form.get("base_path", ""))
+    exclude = request.form.get("exclude")
     selected = request.form.getlist("selected")
 
     if not base_path:
@@ -594,24 +1274,22 @@ def delete():
 
     if not selected:
         flash("No items selected.", "warn")
-        return redirect(url_for("index", path=base_path))
-
-    # tiny delay so UI overlay is perceptible on fast deletes
-    time.sleep(UI_DELAY_SECONDS)
+        return redirect(url_for("index", path=base_path, exclude=exclude))
 
     deleted, errors = delete_dirs(selected)
+    find_venv_dirs.cache_clear()
 
     if deleted > 0:
         flash(f"Deleted {deleted} venv folder(s).", "ok")
     if errors:
         # show up to a few to avoid giant walls of text
         preview = errors[:8]
-        details = "; ".join([f"{p} -> {e}" for p, e in preview])
+        details = "; ".join(f"{p} -> {e}" for p, e in preview)
         extra = "" if len(errors) <= 8 else f" (+{len(errors)-8} more)"
         flash(f"Some items were not deleted: {details}{extra}", "warn")
 
     # Refresh results by redirecting back to scan view
-    return redirect(url_for("index", path=base_path))
+    return redirect(url_for("index", path=base_path, exclude=exclude))
 
 
 # ============================================================
@@ -627,6 +1305,11 @@ if __name__ == "__main__":
 
     open_browser(url)
 
-    app.run(host=HOST, port=PORT, debug=False)
+    # waitress keeps long scans/streams from starving other requests;
+    # PYCLEANER_DEV=1 (or no waitress installed) uses Flask's dev server.
+    if waitress_serve is not None and not os.environ.get("PYCLEANER_DEV"):
+        waitress_serve(app, host=HOST, port=PORT, threads=SERVER_THREADS)
+    else:
+        app.run(host=HOST, port=PORT, debug=False, threaded=True)
 
 